@@ -1,41 +1,68 @@
-def reverse_string(s):
-    left, right = 0, len(s) - 1
+# Tables for the ASCII fast path in is_palindrome: one bytes.translate call
+# lowercases and strips non-alphanumerics in a single C pass
+_ASCII_LOWER = bytes.maketrans(
+    bytes(range(ord('A'), ord('Z') + 1)),
+    bytes(range(ord('a'), ord('z') + 1)),
+)
+_ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
 
-    while left < right:
-        s[left], s[right] = s[right], s[left]
-        left += 1
-        right -= 1
+# 128-entry tables for the two-pointer path: classifying and lowercasing an
+# ASCII character becomes an array load instead of a method call
+_IS_ALNUM = bytes(1 if chr(i).isalnum() else 0 for i in range(128))
+_TO_LOWER = bytes(i + 32 if ord('A') <= i <= ord('Z') else i for i in range(128))
 
+
+def reverse_string(s):
+    # Immutable inputs can't be reversed in place; one C-level slice copy
+    if isinstance(s, (bytes, str)):
+        return s[::-1]
+
+    # Built-in reverse() runs the swap loop in C instead of the interpreter
+    # (works in place for list and bytearray inputs alike)
+    s.reverse()
     return s
 
+def reverse_bytes(b):
+    # Fast path for byte payloads: bytearray reverses in place via a single
+    # C call; bytes and any other buffer exporter (memoryview, array.array)
+    # come back as one reversed C-level copy
+    if isinstance(b, bytearray):
+        b.reverse()
+        return b
+    return bytes(b)[::-1]
+
+
 def is_palindrome(s):
-    left = 0
-    right = len(s) - 1
+    # ASCII fast path: translate does the lowercase + filter in one C pass
+    # and the equality check is a straight memcmp over the byte buffers
+    if s.isascii():
+        t = s.encode().translate(_ASCII_LOWER, delete=_ASCII_NON_ALNUM)
+        return t == t[::-1]
 
+    # Mixed/non-ASCII path: two-pointer scan with no temporary buffers and
+    # early exit on the first mismatch. ASCII characters use the lookup
+    # tables; only genuine non-ASCII codepoints pay the str method calls.
+    left, right = 0, len(s) - 1
     while left < right:
-        while left < right and not s[left].isalnum():
+        c = ord(s[left])
+        if not (_IS_ALNUM[c] if c < 128 else s[left].isalnum()):
             left += 1
-
-        while left < right and not s[right].isalnum():
+            continue
+        d = ord(s[right])
+        if not (_IS_ALNUM[d] if d < 128 else s[right].isalnum()):
             right -= 1
-
-        if s[left].lower() != s[right].lower():
+            continue
+        low_left = chr(_TO_LOWER[c]) if c < 128 else s[left].lower()
+        low_right = chr(_TO_LOWER[d]) if d < 128 else s[right].lower()
+        if low_left != low_right:
             return False
         left += 1
         right -= 1
-
     return True
 
 def remove_duplicates(s):
-    seen = set()
-    result = []
-
-    for char in s:
-        if char not in seen:
-            result.append(char)
-            seen.add(char)
-
-    return ''.join(result)
+    # dict.fromkeys dedupes in one C loop and preserves insertion order
+    return ''.join(dict.fromkeys(s))
 
 def test_string_functions():
     """Test all three string utility functions"""
@@ -49,7 +76,22 @@ def test_string_functions():
     s2 = ['a', 'b']
     reverse_string(s2)
     assert s2 == ['b', 'a'], f"Expected ['b', 'a'], got {s2}"
+
+    assert reverse_string("hello") == "olleh", "str input should return reversed copy"
+    assert reverse_string(b"hello") == b"olleh", "bytes input should return reversed copy"
+    s3 = bytearray(b"hello")
+    reverse_string(s3)
+    assert s3 == bytearray(b"olleh"), "bytearray input should reverse in place"
     print("   ✅ reverse_string passed")
+
+    # Test reverse_bytes
+    print("Testing reverse_bytes...")
+    assert reverse_bytes(b"abc") == b"cba"
+    b1 = bytearray(b"abc")
+    reverse_bytes(b1)
+    assert b1 == bytearray(b"cba"), "bytearray should reverse in place"
+    assert reverse_bytes(memoryview(b"abc")) == b"cba", "buffer exporters should be accepted"
+    print("   ✅ reverse_bytes passed")
     
     # Test is_palindrome
     print("Testing is_palindrome...")
@@ -58,6 +100,8 @@ def test_string_functions():
     assert is_palindrome("") == True
     assert is_palindrome("a") == True
     assert is_palindrome("Madam") == True
+    assert is_palindrome("été") == True  # exercises the non-ASCII path
+    assert is_palindrome("éclair") == False
     print("   ✅ is_palindrome passed")
     
     # Test remove_duplicates
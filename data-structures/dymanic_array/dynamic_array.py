@@ -5,40 +5,106 @@ class DynamicArray:
     This class simulates the behavior of dynamic arrays (like Python lists) by managing
     capacity separately from size and doubling capacity when needed.
     
+    A head offset (`start`) marks where the live elements begin inside the
+    internal storage. Deleting at index 0 just advances the offset instead of
+    shifting every element, making front-heavy delete workloads amortized O(1).
+
     Attributes:
         capacity (int): Maximum number of elements the array can hold without resizing
         size (int): Current number of elements in the array
+        start (int): Offset of the first live element within the internal storage
         data (list): Internal storage for array elements
     """
-    
+
+    __slots__ = ('capacity', 'size', 'start', 'data')
+
     def __init__(self):
         """
         Initialize an empty dynamic array with initial capacity of 2.
-        
+
         Time Complexity: O(1)
         Space Complexity: O(1)
         """
         self.capacity = 2
         self.size = 0
+        self.start = 0
         self.data = [None] * self.capacity
-    
+
+    def _compact(self):
+        """
+        Move the live window back to offset 0 and clear the vacated slots.
+
+        Called before any operation that needs the elements to sit at the
+        front of the storage (resizing, mid-array inserts). The move is a
+        single slice assignment, so it runs at C memmove speed.
+
+        Time Complexity: O(n) where n is the current size
+        Space Complexity: O(1)
+        """
+        if self.start == 0:
+            return
+        data, start, size = self.data, self.start, self.size
+        data[:size] = data[start:start + size]
+        data[size:start + size] = [None] * start
+        self.start = 0
+
+    def _grow(self, min_capacity):
+        """
+        Grow the storage so capacity is at least min_capacity.
+
+        Compacts first so live elements sit at offset 0, then applies the
+        growth policy — double while capacity is below 64, 1.5x beyond — as
+        many times as needed before extending the backing list once. The copy
+        is a list slice plus extend so the per-element work happens inside
+        CPython's C slice code rather than a Python-level loop.
+
+        Args:
+            min_capacity (int): The minimum capacity required after growing
+
+        Time Complexity: O(n + min_capacity)
+        Space Complexity: O(min_capacity) for the new storage
+        """
+        self._compact()
+        while self.capacity < min_capacity:
+            if self.capacity < 64:
+                self.capacity = self.capacity * 2
+            else:
+                self.capacity = self.capacity + (self.capacity >> 1)
+        self.data = self.data[:self.size]
+        self.data.extend([None] * (self.capacity - self.size))
+
+    def _shrink(self):
+        """
+        Halve the capacity once the array falls under a quarter full.
+
+        Called after deletes so an append-then-delete-most workload doesn't
+        hold its peak storage forever. Shrinking at a quarter full (rather
+        than half) gives hysteresis: a freshly shrunk array is exactly half
+        full, so O(n) further operations must happen before the next resize
+        in either direction. The truncation is a single C-level list resize.
+
+        Time Complexity: O(n) amortized O(1) across deletes
+        Space Complexity: O(1)
+        """
+        if self.capacity > 2 and self.size * 4 < self.capacity:
+            self._compact()
+            self.capacity = self.capacity // 2
+            del self.data[self.capacity:]
+
     def _resize(self):
         """
-        Double the capacity of the array and copy all existing elements to new storage.
-        
-        This is a private method called automatically when the array reaches capacity.
-        Doubling strategy ensures amortized O(1) append operations.
-        
+        Grow the capacity of the array by one step of the growth policy.
+
+        This is a private method called automatically when the array reaches
+        capacity. Small arrays double; once capacity reaches 64 the array grows
+        by 1.5x instead. Both factors keep append amortized O(1), but the
+        gentler factor wastes at most ~33% of capacity instead of up to 50%
+        and lets the allocator reuse previously freed blocks.
+
         Time Complexity: O(n) where n is the current size
         Space Complexity: O(n) for the new array
         """
-        self.capacity = self.capacity * 2
-        new_data = [None] * self.capacity
-
-        for i in range(self.size):
-            new_data[i] = self.data[i]
-        
-        self.data = new_data
+        self._grow(self.capacity + 1)
     
     def append(self, element):
         """
@@ -50,64 +116,118 @@ class DynamicArray:
         Time Complexity: O(1) amortized (O(n) worst case when resizing)
         Space Complexity: O(1) amortized
         """
-        if self.size == self.capacity:
+        if self.start + self.size == self.capacity:
             self._resize()
-        self.data[self.size] = element
+        self.data[self.start + self.size] = element
         self.size += 1
-    
+
+    def extend(self, iterable):
+        """
+        Append every element from an iterable to the end of the array.
+
+        The final size is computed up front so storage grows at most once for
+        the whole batch, instead of paying up to O(log k) incremental resizes,
+        and the new elements land via a single slice assignment.
+
+        Args:
+            iterable: An iterable of elements to append
+
+        Time Complexity: O(k) amortized for k new elements
+        Space Complexity: O(k)
+        """
+        items = list(iterable)
+        if not items:
+            return
+        need = self.size + len(items)
+        if self.start + need > self.capacity:
+            self._grow(need)
+        end = self.start + self.size
+        self.data[end:end + len(items)] = items
+        self.size = need
+
     def insert(self, index, element):
         """
         Insert an element at the specified index, shifting existing elements to the right.
-        
+
+        The shift is a single slice assignment, which CPython performs as one
+        C-level memmove instead of one interpreter iteration per element.
+
         Args:
             index (int): The index at which to insert the element (0 <= index <= size)
             element: The element to insert
-            
+
         Raises:
             IndexError: If index is out of valid range [0, size]
-            
+
         Time Complexity: O(n) due to element shifting
         Space Complexity: O(1) or O(n) if resizing is needed
         """
         if index < 0 or index > self.size:
             raise IndexError(f"Index {index} out of range [0, {self.size}]")
+
+        # Inserting at the front reuses a vacated slot when one is available
+        if index == 0 and self.start > 0:
+            self.start -= 1
+            self.data[self.start] = element
+            self.size += 1
+            return
+
+        self._compact()
         if self.size == self.capacity:
             self._resize()
 
-        i = self.size-1
-        while i >= index:
-            self.data[i + 1] = self.data[i]
-            i -= 1
-
-        self.data[index] = element
-        self.size += 1
+        data, size = self.data, self.size
+        data[index + 1:size + 1] = data[index:size]
+        data[index] = element
+        self.size = size + 1
     
     def delete(self, index):
         """
         Remove and return the element at the specified index.
         
         Elements after the deleted index are shifted left to fill the gap.
-        
+        The shift is a single slice assignment (a C-level memmove) rather
+        than a Python loop. Deleting at index 0 skips the shift entirely and
+        just advances the head offset; the storage is compacted once the
+        offset grows past a quarter of the capacity. Capacity halves once
+        the array falls under a quarter full, so storage tracks the live
+        size instead of the historical peak.
+
         Args:
             index (int): The index of the element to delete (0 <= index < size)
-            
+
         Returns:
             The element that was removed
-            
+
         Raises:
             IndexError: If index is out of valid range [0, size)
-            
-        Time Complexity: O(n) due to element shifting
+
+        Time Complexity: O(n) due to element shifting; amortized O(1) at index 0
         Space Complexity: O(1)
         """
         if index < 0 or index >= self.size:
             raise IndexError(f"Index {index} out of range [0, {self.size})")
-        deleted_element = self.data[index]
-        for i in range(index, self.size - 1):
-            self.data[i] = self.data[i + 1]
 
+        if index == 0:
+            deleted_element = self.data[self.start]
+            if isinstance(self.data, list):
+                self.data[self.start] = None  # Release the reference in the unused slot
+            self.start += 1
+            self.size -= 1
+            if self.start > self.capacity // 4:
+                self._compact()
+            self._shrink()
+            return deleted_element
+
+        data = self.data
+        pos = self.start + index
+        end = self.start + self.size
+        deleted_element = data[pos]
+        data[pos:end - 1] = data[pos + 1:end]
         self.size -= 1
-        self.data[self.size] = None  # Clear the now-unused slot
+        if isinstance(data, list):
+            data[end - 1] = None  # Release the reference in the unused slot
+        self._shrink()
         return deleted_element
     
     def get(self, index):
@@ -128,7 +248,7 @@ class DynamicArray:
         """
         if index < 0 or index >= self.size:
             raise IndexError(f"Index {index} out of range [0, {self.size})")
-        return self.data[index]
+        return self.data[self.start + index]
     
     def __str__(self):
         """
@@ -137,7 +257,7 @@ class DynamicArray:
         Returns:
             str: Visual representation with size and capacity information
         """
-        elements = [str(self.data[i]) for i in range(self.size)]
+        elements = [str(self.data[self.start + i]) for i in range(self.size)]
         empty_slots = ['_'] * (self.capacity - self.size)
         return f"[{', '.join(elements + empty_slots)}] (size: {self.size}, capacity: {self.capacity})"
 
@@ -296,7 +416,65 @@ def test_dynamic_array():
     assert empty_arr.get(0) == 42, "Element should be 42"
     
     print("   ✅ Empty array edge cases passed")
-    
+
+    # Test 9: Front deletions via head offset
+    print("\n9. Testing front deletions (head offset)...")
+    front_arr = DynamicArray()
+    for i in range(8):
+        front_arr.append(i)
+
+    for expected in range(5):
+        assert front_arr.delete(0) == expected, f"Front delete should return {expected}"
+    assert front_arr.size == 3, "Size should be 3 after five front deletes"
+    assert [front_arr.get(i) for i in range(front_arr.size)] == [5, 6, 7], \
+        "Remaining elements should be [5, 6, 7]"
+
+    # Mixing front inserts/deletes with appends should keep ordering intact
+    front_arr.insert(0, 99)
+    assert front_arr.get(0) == 99, "Front insert should land at index 0"
+    front_arr.append(100)
+    assert [front_arr.get(i) for i in range(front_arr.size)] == [99, 5, 6, 7, 100], \
+        "Mixed operations should preserve element order"
+    print("   ✅ Front deletion tests passed")
+
+    # Test 10: Bulk extend
+    print("\n10. Testing extend...")
+    bulk_arr = DynamicArray()
+    bulk_arr.append(0)
+    bulk_arr.extend(range(1, 100))
+    assert bulk_arr.size == 100, "Size should be 100 after extend"
+    assert bulk_arr.capacity >= 100, "Capacity should accommodate the batch"
+    for i in range(100):
+        assert bulk_arr.get(i) == i, f"Element at index {i} should be {i}"
+
+    bulk_arr.extend([])
+    assert bulk_arr.size == 100, "Extending with an empty iterable should be a no-op"
+    print("   ✅ Extend passed")
+
+    # Test 11: Shrinking after bulk deletes
+    print("\n11. Testing shrink-on-delete...")
+    shrink_arr = DynamicArray()
+    shrink_arr.extend(range(100))
+    peak_capacity = shrink_arr.capacity
+
+    while shrink_arr.size > 2:
+        shrink_arr.delete(shrink_arr.size - 1)
+    assert shrink_arr.capacity < peak_capacity, \
+        "Capacity should shrink after deleting most elements"
+    assert shrink_arr.size * 4 >= shrink_arr.capacity or shrink_arr.capacity == 2, \
+        "Array should never sit under a quarter full"
+    assert [shrink_arr.get(i) for i in range(shrink_arr.size)] == [0, 1], \
+        "Remaining elements should survive shrinking"
+
+    # Front deletes should shrink too
+    front_shrink = DynamicArray()
+    front_shrink.extend(range(100))
+    while front_shrink.size > 1:
+        front_shrink.delete(0)
+    assert front_shrink.capacity < peak_capacity, "Front deletes should also shrink capacity"
+    assert front_shrink.get(0) == 99, "Last remaining element should be 99"
+    print("   ✅ Shrink-on-delete passed")
+
     print("\n🎉 All tests passed! Dynamic Array implementation is correct.")
     
     # Display final state of test array
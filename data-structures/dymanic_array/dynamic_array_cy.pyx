@@ -0,0 +1,118 @@
+# cython: language_level=3
+"""
+Optional Cython-compiled dynamic array.
+
+This is a native-code counterpart to the pure-Python DynamicArray in
+dynamic_array.py, for benchmarking how much of the cost of the Python
+version is interpreter overhead. Storage is a raw PyObject** buffer from
+PyMem_Malloc; grows go through PyMem_Realloc (which can often extend the
+allocation in place, skipping the copy), and insert/delete shifts are
+plain memmove calls over pointer slots.
+
+The pure-Python module remains the canonical implementation; this
+extension is not imported by anything else in the repo. Build in place
+with Cython installed:
+
+    python setup.py build_ext --inplace
+"""
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.ref cimport PyObject, Py_INCREF, Py_XDECREF
+from libc.string cimport memmove
+
+
+cdef class CyDynamicArray:
+    """
+    A dynamic array over a raw PyObject** buffer with memmove-based shifts.
+
+    Mirrors the core DynamicArray operations (append/insert/delete/get) and
+    its growth policy: double while capacity is below 64, 1.5x beyond.
+    """
+
+    cdef PyObject** data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+
+    def __cinit__(self):
+        self.capacity = 2
+        self.size = 0
+        self.data = <PyObject**>PyMem_Malloc(self.capacity * sizeof(PyObject*))
+        if self.data == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        cdef Py_ssize_t i
+        if self.data != NULL:
+            for i in range(self.size):
+                Py_XDECREF(self.data[i])
+            PyMem_Free(self.data)
+
+    def __len__(self):
+        return self.size
+
+    cdef int _resize(self) except -1:
+        """Grow the buffer one policy step via PyMem_Realloc."""
+        cdef Py_ssize_t new_capacity
+        cdef PyObject** new_data
+
+        if self.capacity < 64:
+            new_capacity = self.capacity * 2
+        else:
+            new_capacity = self.capacity + (self.capacity >> 1)
+
+        new_data = <PyObject**>PyMem_Realloc(self.data, new_capacity * sizeof(PyObject*))
+        if new_data == NULL:
+            raise MemoryError()
+        self.data = new_data
+        self.capacity = new_capacity
+        return 0
+
+    def append(self, object element):
+        """Add an element to the end of the array. Amortized O(1)."""
+        if self.size == self.capacity:
+            self._resize()
+        Py_INCREF(element)
+        self.data[self.size] = <PyObject*>element
+        self.size += 1
+
+    def insert(self, Py_ssize_t index, object element):
+        """Insert an element at index, shifting the tail right with memmove. O(n)."""
+        if index < 0 or index > self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
+        if self.size == self.capacity:
+            self._resize()
+
+        memmove(self.data + index + 1, self.data + index,
+                (self.size - index) * sizeof(PyObject*))
+        Py_INCREF(element)
+        self.data[index] = <PyObject*>element
+        self.size += 1
+
+    def delete(self, Py_ssize_t index):
+        """Remove and return the element at index, shifting the tail left. O(n)."""
+        cdef PyObject* ptr
+        cdef object deleted_element
+
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+
+        ptr = self.data[index]
+        memmove(self.data + index, self.data + index + 1,
+                (self.size - index - 1) * sizeof(PyObject*))
+        self.size -= 1
+
+        deleted_element = <object>ptr  # new reference for the caller
+        Py_XDECREF(ptr)  # drop the reference the buffer held
+        return deleted_element
+
+    def get(self, Py_ssize_t index):
+        """Return the element at index. O(1)."""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        return <object>self.data[index]
+
+    def __str__(self):
+        cdef Py_ssize_t i
+        elements = [str(<object>self.data[i]) for i in range(self.size)]
+        empty_slots = ['_'] * (self.capacity - self.size)
+        return f"[{', '.join(elements + empty_slots)}] (size: {self.size}, capacity: {self.capacity})"
@@ -0,0 +1,253 @@
+from array import array
+
+# All storage words are 64 bits; Python ints are unbounded, so left shifts
+# must be masked back down before they are stored into the array('Q') buffer
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+
+
+class DynamicBitArray:
+    """
+    A dynamic array of bits packed 64 to a machine word.
+
+    Storing booleans in a list costs a full pointer per slot plus the bool
+    object behind it; packing them into an array.array('Q') of 64-bit words
+    cuts that to one bit per element. Reads and appends are O(1) shift/mask
+    operations, and insert/delete shift whole words at a time, so the O(n)
+    shuffle touches n/64 words instead of n list slots.
+
+    Bits above `size` are always zero — operations rely on that invariant.
+
+    Attributes:
+        size (int): Current number of bits in the array
+        words (array.array): 64-bit word storage, least significant bit first
+    """
+
+    __slots__ = ('size', 'words')
+
+    def __init__(self):
+        """
+        Initialize an empty bit array with one zeroed storage word.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.size = 0
+        self.words = array('Q', [0])
+
+    @property
+    def capacity(self):
+        """Total number of bit slots currently allocated."""
+        return len(self.words) * _WORD_BITS
+
+    def append(self, bit):
+        """
+        Add a bit to the end of the array.
+
+        Args:
+            bit: Truthy for 1, falsy for 0
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1) amortized
+        """
+        if self.size == self.capacity:
+            self.words.append(0)
+        if bit:
+            w, r = divmod(self.size, _WORD_BITS)
+            self.words[w] |= 1 << r
+        self.size += 1
+
+    def insert(self, index, bit):
+        """
+        Insert a bit at the specified index, shifting later bits up by one.
+
+        Higher words shift left one bit each, taking their new low bit from
+        the word below; only the word containing the index is split and
+        reassembled around the new bit. The whole shuffle is O(n/64) word
+        operations instead of O(n) element moves.
+
+        Args:
+            index (int): The index at which to insert the bit (0 <= index <= size)
+            bit: Truthy for 1, falsy for 0
+
+        Raises:
+            IndexError: If index is out of valid range [0, size]
+
+        Time Complexity: O(n / 64)
+        Space Complexity: O(1) amortized
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size}]")
+        if self.size == self.capacity:
+            self.words.append(0)
+
+        words = self.words
+        w, r = divmod(index, _WORD_BITS)
+        used_words = (self.size // _WORD_BITS) + 1
+
+        # Shift higher words first so each reads its neighbour's old value
+        for k in range(used_words - 1, w, -1):
+            words[k] = ((words[k] << 1) & _WORD_MASK) | (words[k - 1] >> (_WORD_BITS - 1))
+
+        low = words[w] & ((1 << r) - 1)
+        high = words[w] >> r
+        words[w] = low | ((1 << r) if bit else 0) | ((high << (r + 1)) & _WORD_MASK)
+        self.size += 1
+
+    def delete(self, index):
+        """
+        Remove and return the bit at the specified index.
+
+        The containing word closes the gap with shifts and masks; higher
+        words shift right one bit each, passing their low bit downward.
+        Fully vacated trailing words are dropped so storage tracks size.
+
+        Args:
+            index (int): The index of the bit to delete (0 <= index < size)
+
+        Returns:
+            int: The bit (0 or 1) that was removed
+
+        Raises:
+            IndexError: If index is out of valid range [0, size)
+
+        Time Complexity: O(n / 64)
+        Space Complexity: O(1)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+
+        words = self.words
+        w, r = divmod(index, _WORD_BITS)
+        used_words = (self.size + _WORD_BITS - 1) // _WORD_BITS
+
+        deleted_bit = (words[w] >> r) & 1
+        low = words[w] & ((1 << r) - 1)
+        high = words[w] >> (r + 1)
+        words[w] = low | (high << r)
+        if w + 1 < used_words:
+            words[w] |= (words[w + 1] & 1) << (_WORD_BITS - 1)
+
+        for k in range(w + 1, used_words):
+            words[k] >>= 1
+            if k + 1 < used_words:
+                words[k] |= (words[k + 1] & 1) << (_WORD_BITS - 1)
+
+        self.size -= 1
+        while len(words) > 1 and (len(words) - 1) * _WORD_BITS >= self.size:
+            words.pop()
+        return deleted_bit
+
+    def get(self, index):
+        """
+        Return the bit at the specified index.
+
+        Args:
+            index (int): The index of the bit to retrieve (0 <= index < size)
+
+        Returns:
+            int: The bit (0 or 1) at the specified index
+
+        Raises:
+            IndexError: If index is out of valid range [0, size)
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        w, r = divmod(index, _WORD_BITS)
+        return (self.words[w] >> r) & 1
+
+    def __str__(self):
+        """
+        Return a string representation of the bit array.
+
+        Returns:
+            str: The bits in index order with size and capacity information
+        """
+        bits = ''.join(str(self.get(i)) for i in range(self.size))
+        return f"[{bits}] (size: {self.size}, capacity: {self.capacity})"
+
+
+def test_dynamic_bit_array():
+    """
+    Test suite for the DynamicBitArray class.
+    Covers word-boundary crossing, mirror comparison against a plain list,
+    and error conditions.
+    """
+    print("🧪 Running Dynamic Bit Array Tests...")
+
+    # Test 1: Initialization
+    print("\n1. Testing initialization...")
+    bits = DynamicBitArray()
+    assert bits.size == 0, "Initial size should be 0"
+    assert bits.capacity == 64, "Initial capacity should be one 64-bit word"
+    print("   ✅ Initialization passed")
+
+    # Test 2: Append and get across a word boundary
+    print("\n2. Testing append/get across word boundaries...")
+    pattern = [(i * 7) % 3 == 0 for i in range(150)]
+    for b in pattern:
+        bits.append(b)
+    assert bits.size == 150, "Size should be 150"
+    assert bits.capacity == 192, "Capacity should have grown to three words"
+    for i, b in enumerate(pattern):
+        assert bits.get(i) == int(b), f"Bit at index {i} should be {int(b)}"
+    print("   ✅ Append/get passed")
+
+    # Test 3: Insert and delete mirrored against a plain list
+    print("\n3. Testing insert/delete against a list mirror...")
+    packed = DynamicBitArray()
+    mirror = []
+    for step in range(300):
+        index = (step * 31) % (len(mirror) + 1)
+        bit = step % 2
+        packed.insert(index, bit)
+        mirror.insert(index, bit)
+    for step in range(150):
+        index = (step * 17) % len(mirror)
+        assert packed.delete(index) == mirror.pop(index), \
+            f"Delete at index {index} should return the mirrored bit"
+    assert packed.size == len(mirror), "Sizes should match after mixed operations"
+    for i, b in enumerate(mirror):
+        assert packed.get(i) == b, f"Bit at index {i} should be {b}"
+    print("   ✅ Insert/delete mirror passed")
+
+    # Test 4: Trailing words are released
+    print("\n4. Testing storage release after deletes...")
+    while packed.size > 10:
+        packed.delete(packed.size - 1)
+    assert packed.capacity == 64, "Storage should drop back to one word"
+    print("   ✅ Storage release passed")
+
+    # Test 5: Error handling
+    print("\n5. Testing error handling...")
+    try:
+        bits.get(bits.size)
+        assert False, "Should raise IndexError for index >= size"
+    except IndexError:
+        pass
+
+    try:
+        bits.delete(-1)
+        assert False, "Should raise IndexError for negative index"
+    except IndexError:
+        pass
+
+    try:
+        bits.insert(bits.size + 1, 1)
+        assert False, "Should raise IndexError for index > size"
+    except IndexError:
+        pass
+    print("   ✅ Error handling passed")
+
+    print("\n🎉 All tests passed! Dynamic Bit Array implementation is correct.")
+    small = DynamicBitArray()
+    for b in (1, 0, 1, 1, 0):
+        small.append(b)
+    print(f"\nExample array state: {small}")
+
+
+if __name__ == "__main__":
+    test_dynamic_bit_array()
@@ -0,0 +1,161 @@
+class IncrementalDynamicArray:
+    """
+    A dynamic array that spreads resize copying across subsequent appends.
+
+    The standard DynamicArray stalls for O(n) at every resize while it copies
+    the whole array. This variant keeps the old storage alive when it grows
+    and migrates two elements per append, so the copy finishes before the new
+    storage can fill up and every single append is worst-case O(1) — useful
+    when latency matters more than throughput (game loops, soft real-time).
+
+    Reads check whether the requested slot has migrated yet and fall back to
+    the old segment if not, so lookups stay O(1).
+
+    Attributes:
+        capacity (int): Maximum number of elements the current storage can hold
+        size (int): Current number of elements in the array
+        data (list): Current storage; new appends and migrated elements live here
+        old_data (list or None): Previous storage still being migrated, if any
+        old_remaining (int): Number of elements not yet migrated out of old_data
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty incremental dynamic array with initial capacity of 2.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.capacity = 2
+        self.size = 0
+        self.data = [None] * self.capacity
+        self.old_data = None
+        self.old_remaining = 0
+
+    def append(self, element):
+        """
+        Add an element to the end of the array in worst-case O(1) time.
+
+        When storage is full, a segment twice the size is allocated but the
+        old elements are NOT copied immediately. Instead, each append migrates
+        two elements from the tail of the old segment; with n elements to move
+        and n free slots to fill before the next grow, migration always
+        finishes in the first n/2 appends.
+
+        Args:
+            element: The element to add to the array
+
+        Time Complexity: O(1) worst case
+        Space Complexity: O(1) amortized
+        """
+        if self.size == self.capacity:
+            self.old_data = self.data
+            self.old_remaining = self.size
+            self.capacity = self.capacity * 2
+            self.data = [None] * self.capacity
+
+        self.data[self.size] = element
+        self.size += 1
+
+        if self.old_data is not None:
+            for _ in range(2):
+                if self.old_remaining > 0:
+                    self.old_remaining -= 1
+                    self.data[self.old_remaining] = self.old_data[self.old_remaining]
+            if self.old_remaining == 0:
+                self.old_data = None
+
+    def get(self, index):
+        """
+        Return the element at the specified index.
+
+        Elements below old_remaining have not migrated yet and are read from
+        the old segment; everything else lives in the current storage.
+
+        Args:
+            index (int): The index of the element to retrieve (0 <= index < size)
+
+        Returns:
+            The element at the specified index
+
+        Raises:
+            IndexError: If index is out of valid range [0, size)
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        if index < self.old_remaining:
+            return self.old_data[index]
+        return self.data[index]
+
+    def __str__(self):
+        """
+        Return a string representation of the array showing used and unused slots.
+
+        Returns:
+            str: Visual representation with size and capacity information
+        """
+        elements = [str(self.get(i)) for i in range(self.size)]
+        empty_slots = ['_'] * (self.capacity - self.size)
+        return f"[{', '.join(elements + empty_slots)}] (size: {self.size}, capacity: {self.capacity})"
+
+
+def test_incremental_dynamic_array():
+    """
+    Test suite for the IncrementalDynamicArray class.
+    Verifies ordering across grows, mid-migration reads, and error conditions.
+    """
+    print("🧪 Running Incremental Dynamic Array Tests...")
+
+    # Test 1: Initialization
+    print("\n1. Testing initialization...")
+    arr = IncrementalDynamicArray()
+    assert arr.size == 0, "Initial size should be 0"
+    assert arr.capacity == 2, "Initial capacity should be 2"
+    assert arr.old_data is None, "No migration should be pending initially"
+    print("   ✅ Initialization passed")
+
+    # Test 2: Reads during migration
+    print("\n2. Testing reads mid-migration...")
+    for i in range(3):
+        arr.append(i)
+    # The third append triggered a grow; all elements must read correctly
+    # whether they have migrated or not
+    for i in range(3):
+        assert arr.get(i) == i, f"Element at index {i} should be {i}"
+    print("   ✅ Mid-migration reads passed")
+
+    # Test 3: Ordering across many grows
+    print("\n3. Testing ordering across repeated grows...")
+    big = IncrementalDynamicArray()
+    for i in range(500):
+        big.append(i)
+        assert big.get(i) == i, f"Element {i} should read back immediately"
+    for i in range(500):
+        assert big.get(i) == i, f"Element at index {i} should be {i}"
+    assert big.old_data is None, "Migration should be complete after filling half the storage"
+    print("   ✅ Ordering across grows passed")
+
+    # Test 4: Error handling
+    print("\n4. Testing error handling...")
+    try:
+        arr.get(-1)
+        assert False, "Should raise IndexError for negative index"
+    except IndexError:
+        pass
+
+    try:
+        arr.get(arr.size)
+        assert False, "Should raise IndexError for index >= size"
+    except IndexError:
+        pass
+    print("   ✅ Error handling passed")
+
+    print("\n🎉 All tests passed! Incremental Dynamic Array implementation is correct.")
+    print(f"\nFinal test array state: {arr}")
+
+
+if __name__ == "__main__":
+    test_incremental_dynamic_array()
@@ -0,0 +1,173 @@
+class SegmentedDynamicArray:
+    """
+    A dynamic array that grows by adding segments instead of copying.
+
+    Every other variant in this folder eventually pays an O(n) copy (up front
+    or spread across appends) when it outgrows its storage. This one never
+    copies: storage is a list of segments with doubling sizes 2, 4, 8, ...,
+    and growing just appends a fresh segment. Element i lives at a (segment,
+    offset) pair computed in O(1) with bit arithmetic, because the capacity
+    in front of segment k is 2^(k+1) - 2.
+
+    The price is an extra indirection plus a few arithmetic ops on every get,
+    and elements are no longer contiguous in memory across segments.
+
+    Attributes:
+        capacity (int): Total number of slots across all segments
+        size (int): Current number of elements in the array
+        segments (list): List of segment lists with sizes 2, 4, 8, ...
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty segmented dynamic array with one 2-slot segment.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.capacity = 2
+        self.size = 0
+        self.segments = [[None] * 2]
+
+    @staticmethod
+    def _locate(index):
+        """
+        Map a logical index to its (segment, offset) pair.
+
+        Segment k covers logical indices [2^(k+1) - 2, 2^(k+2) - 2), so the
+        segment number falls out of the bit length of index + 2.
+
+        Args:
+            index (int): Logical element index
+
+        Returns:
+            tuple: (segment number, offset within that segment)
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        k = (index + 2).bit_length() - 2
+        return k, index - ((1 << (k + 1)) - 2)
+
+    def append(self, element):
+        """
+        Add an element to the end of the array without ever copying.
+
+        When all segments are full, a new segment twice the size of the last
+        one is allocated; existing elements stay exactly where they are.
+
+        Args:
+            element: The element to add to the array
+
+        Time Complexity: O(1) worst case (segment allocation aside)
+        Space Complexity: O(1) amortized
+        """
+        if self.size == self.capacity:
+            self.segments.append([None] * (len(self.segments[-1]) * 2))
+            self.capacity = self.capacity * 2 + 2
+
+        k, offset = self._locate(self.size)
+        self.segments[k][offset] = element
+        self.size += 1
+
+    def get(self, index):
+        """
+        Return the element at the specified index.
+
+        Args:
+            index (int): The index of the element to retrieve (0 <= index < size)
+
+        Returns:
+            The element at the specified index
+
+        Raises:
+            IndexError: If index is out of valid range [0, size)
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} out of range [0, {self.size})")
+        k, offset = self._locate(index)
+        return self.segments[k][offset]
+
+    def __str__(self):
+        """
+        Return a string representation of the array grouped by segment.
+
+        Returns:
+            str: Visual representation with size and capacity information
+        """
+        parts = []
+        remaining = self.size
+        for segment in self.segments:
+            used = min(remaining, len(segment))
+            slots = [str(segment[i]) for i in range(used)]
+            slots += ['_'] * (len(segment) - used)
+            parts.append(f"[{', '.join(slots)}]")
+            remaining -= used
+        return f"{' '.join(parts)} (size: {self.size}, capacity: {self.capacity})"
+
+
+def test_segmented_dynamic_array():
+    """
+    Test suite for the SegmentedDynamicArray class.
+    Verifies index mapping, growth without copying, and error conditions.
+    """
+    print("🧪 Running Segmented Dynamic Array Tests...")
+
+    # Test 1: Initialization
+    print("\n1. Testing initialization...")
+    arr = SegmentedDynamicArray()
+    assert arr.size == 0, "Initial size should be 0"
+    assert arr.capacity == 2, "Initial capacity should be 2"
+    assert len(arr.segments) == 1, "Should start with a single segment"
+    print("   ✅ Initialization passed")
+
+    # Test 2: Index mapping
+    print("\n2. Testing index-to-segment mapping...")
+    assert SegmentedDynamicArray._locate(0) == (0, 0)
+    assert SegmentedDynamicArray._locate(1) == (0, 1)
+    assert SegmentedDynamicArray._locate(2) == (1, 0)
+    assert SegmentedDynamicArray._locate(5) == (1, 3)
+    assert SegmentedDynamicArray._locate(6) == (2, 0)
+    assert SegmentedDynamicArray._locate(13) == (2, 7)
+    print("   ✅ Index mapping passed")
+
+    # Test 3: Growth without copying
+    print("\n3. Testing growth across segments...")
+    first_segment = arr.segments[0]
+    for i in range(200):
+        arr.append(i * 3)
+    assert arr.size == 200, "Size should be 200"
+    assert arr.segments[0] is first_segment, "Existing segments should never be replaced"
+    assert [len(s) for s in arr.segments] == [2, 4, 8, 16, 32, 64, 128], \
+        "Segment sizes should double"
+    for i in range(200):
+        assert arr.get(i) == i * 3, f"Element at index {i} should be {i * 3}"
+    print("   ✅ Growth across segments passed")
+
+    # Test 4: Error handling
+    print("\n4. Testing error handling...")
+    try:
+        arr.get(-1)
+        assert False, "Should raise IndexError for negative index"
+    except IndexError:
+        pass
+
+    try:
+        arr.get(arr.size)
+        assert False, "Should raise IndexError for index >= size"
+    except IndexError:
+        pass
+    print("   ✅ Error handling passed")
+
+    print("\n🎉 All tests passed! Segmented Dynamic Array implementation is correct.")
+    small = SegmentedDynamicArray()
+    for i in range(5):
+        small.append(i)
+    print(f"\nExample array state: {small}")
+
+
+if __name__ == "__main__":
+    test_segmented_dynamic_array()
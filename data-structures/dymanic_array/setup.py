@@ -0,0 +1,15 @@
+"""
+Build script for the optional Cython dynamic array extension.
+
+Requires Cython. Build in place from this directory:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="dynamic-array-cy",
+    ext_modules=cythonize("dynamic_array_cy.pyx"),
+)